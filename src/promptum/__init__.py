@@ -1,4 +1,6 @@
-from promptum.providers import LLMProvider, Metrics, OpenRouterClient, RetryConfig, RetryStrategy
+from typing import TYPE_CHECKING, Any
+
+from promptum.providers import LLMProvider, Metrics, RetryConfig, RetryStrategy
 from promptum.session import Prompt, Report, Runner, Session, Summary, TestResult
 from promptum.validation import (
     Contains,
@@ -8,6 +10,9 @@ from promptum.validation import (
     Validator,
 )
 
+if TYPE_CHECKING:
+    from promptum.providers.openrouter import OpenRouterClient
+
 __version__ = "0.0.7"
 
 __all__ = [
@@ -28,3 +33,11 @@ __all__ = [
     "Session",
     "Report",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "OpenRouterClient":
+        from promptum.providers.openrouter import OpenRouterClient
+
+        return OpenRouterClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
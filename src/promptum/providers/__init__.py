@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from promptum.providers.exceptions import (
     ProviderError,
     ProviderHTTPStatusError,
@@ -7,10 +9,12 @@ from promptum.providers.exceptions import (
     ProviderTransientError,
 )
 from promptum.providers.metrics import Metrics
-from promptum.providers.openrouter import OpenRouterClient
 from promptum.providers.protocol import LLMProvider
 from promptum.providers.retry import RetryConfig, RetryStrategy
 
+if TYPE_CHECKING:
+    from promptum.providers.openrouter import OpenRouterClient
+
 __all__ = [
     "LLMProvider",
     "Metrics",
@@ -24,3 +28,12 @@ __all__ = [
     "RetryConfig",
     "RetryStrategy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so importing the package does not load the HTTP client stack.
+    if name == "OpenRouterClient":
+        from promptum.providers.openrouter import OpenRouterClient
+
+        return OpenRouterClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
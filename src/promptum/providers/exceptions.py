@@ -1,10 +1,14 @@
 class ProviderError(Exception):
     """Base exception for all provider errors."""
 
+    __slots__ = ()
+
 
 class ProviderNotInitializedError(ProviderError):
     """Client not initialized (missing async context manager)."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("Client not initialized. Use async context manager.")
 
@@ -12,6 +16,8 @@ class ProviderNotInitializedError(ProviderError):
 class ProviderResponseParseError(ProviderError):
     """Invalid API response structure."""
 
+    __slots__ = ("original_error",)
+
     def __init__(self, original_error: Exception) -> None:
         self.original_error = original_error
         super().__init__(f"Invalid API response structure: {original_error}")
@@ -20,6 +26,8 @@ class ProviderResponseParseError(ProviderError):
 class ProviderHTTPStatusError(ProviderError):
     """Non-retryable HTTP status error."""
 
+    __slots__ = ("status_code", "response_body")
+
     def __init__(self, status_code: int, response_body: str) -> None:
         self.status_code = status_code
         self.response_body = response_body
@@ -29,6 +37,8 @@ class ProviderHTTPStatusError(ProviderError):
 class ProviderTransientError(ProviderError):
     """Transient error (timeout/network) after all retries exhausted."""
 
+    __slots__ = ("attempts", "retry_delays")
+
     def __init__(self, attempts: int, retry_delays: list[float]) -> None:
         self.attempts = attempts
         self.retry_delays = retry_delays
@@ -38,6 +48,8 @@ class ProviderTransientError(ProviderError):
 class ProviderRetryExhaustedError(ProviderError):
     """Retryable HTTP status after all retries exhausted."""
 
+    __slots__ = ("attempts", "last_status_code", "last_response_body", "retry_delays")
+
     def __init__(
         self,
         attempts: int,
@@ -1,8 +1,11 @@
 import asyncio
 import time
+import weakref
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
+import orjson
 
 from promptum.providers.exceptions import (
     ProviderHTTPStatusError,
@@ -14,6 +17,60 @@ from promptum.providers.exceptions import (
 from promptum.providers.metrics import Metrics
 from promptum.providers.retry import RetryConfig, RetryStrategy
 
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30,
+)
+
+_TRANSPORT_OPTIONS: dict[str, Any] = {
+    "limits": _CONNECTION_LIMITS,
+    "http2": True,
+    "retries": 0,
+}
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Reference-counted transport shared by all clients open on one event loop."""
+
+    def __init__(self) -> None:
+        self._transport = httpx.AsyncHTTPTransport(**_TRANSPORT_OPTIONS)
+        self._users = 0
+
+    def acquire(self) -> "_SharedTransport":
+        self._users += 1
+        return self
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        self._users -= 1
+        if self._users == 0:
+            loop = asyncio.get_running_loop()
+            if _SHARED_TRANSPORTS.get(loop) is self:
+                del _SHARED_TRANSPORTS[loop]
+            await self._transport.aclose()
+
+
+_SHARED_TRANSPORTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedTransport] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _acquire_transport() -> httpx.AsyncBaseTransport:
+    # Connections are bound to the loop that opened them, so each loop gets its own pool.
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Not on an asyncio loop (e.g. trio): the client owns a pool of its own.
+        return httpx.AsyncHTTPTransport(**_TRANSPORT_OPTIONS)
+
+    transport = _SHARED_TRANSPORTS.get(loop)
+    if transport is None:
+        transport = _SHARED_TRANSPORTS[loop] = _SharedTransport()
+    return transport.acquire()
+
 
 class OpenRouterClient:
     def __init__(
@@ -35,12 +92,14 @@ class OpenRouterClient:
                 "Content-Type": "application/json",
             },
             timeout=self.default_retry_config.timeout,
+            transport=_acquire_transport(),
         )
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         if self._client:
             await self._client.aclose()
+            self._client = None
 
     async def generate(
         self,
@@ -56,7 +115,6 @@ class OpenRouterClient:
             raise ProviderNotInitializedError()
 
         config = retry_config or self.default_retry_config
-        retry_delays: list[float] = []
         last_status_code: int = 0
         last_response_body: str = ""
 
@@ -93,9 +151,9 @@ class OpenRouterClient:
                 if response.status_code == 200:
                     latency_ms = (time.perf_counter() - start_time) * 1000
                     try:
-                        data = response.json()
+                        data = orjson.loads(response.content)
                         content = data["choices"][0]["message"]["content"]
-                    except (KeyError, IndexError, TypeError) as e:
+                    except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
                         raise ProviderResponseParseError(e) from e
 
                     usage = data.get("usage", {})
@@ -105,7 +163,7 @@ class OpenRouterClient:
                         completion_tokens=usage.get("completion_tokens"),
                         total_tokens=usage.get("total_tokens"),
                         cost_usd=usage.get("cost") or usage.get("total_cost"),
-                        retry_delays=tuple(retry_delays),
+                        retry_delays=tuple(self._retry_delays(attempt, config)) if attempt else (),
                     )
 
                     return content, metrics
@@ -122,27 +180,29 @@ class OpenRouterClient:
                 last_response_body = response.text
 
                 if attempt < config.max_attempts - 1:
-                    delay = self._calculate_delay(attempt, config)
-                    retry_delays.append(delay)
-                    await self._sleep(delay)
+                    await self._sleep(self._calculate_delay(attempt, config))
 
             except (httpx.TimeoutException, httpx.NetworkError) as e:
                 if attempt < config.max_attempts - 1:
-                    delay = self._calculate_delay(attempt, config)
-                    retry_delays.append(delay)
-                    await self._sleep(delay)
+                    await self._sleep(self._calculate_delay(attempt, config))
                 else:
                     raise ProviderTransientError(
-                        config.max_attempts, retry_delays
+                        config.max_attempts, list(self._retry_delays(attempt, config))
                     ) from e
 
         raise ProviderRetryExhaustedError(
-            config.max_attempts, last_status_code, last_response_body, retry_delays
+            config.max_attempts,
+            last_status_code,
+            last_response_body,
+            list(self._retry_delays(config.max_attempts - 1, config)),
         )
 
     async def _sleep(self, delay: float) -> None:
         await asyncio.sleep(delay)
 
+    def _retry_delays(self, retries: int, config: RetryConfig) -> Iterator[float]:
+        return (self._calculate_delay(attempt, config) for attempt in range(retries))
+
     def _calculate_delay(self, attempt: int, config: RetryConfig) -> float:
         if config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
             delay = config.initial_delay * (config.exponential_base**attempt)
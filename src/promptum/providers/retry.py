@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Collection
 from dataclasses import dataclass
 from enum import Enum
 
@@ -15,5 +15,8 @@ class RetryConfig:
     initial_delay: float = 1.0
     max_delay: float = 60.0
     exponential_base: float = 2.0
-    retryable_status_codes: Sequence[int] = (429, 500, 502, 503, 504)
+    retryable_status_codes: Collection[int] = frozenset({429, 500, 502, 503, 504})
     timeout: float = 60.0
+
+    def __post_init__(self):
+        object.__setattr__(self, "retryable_status_codes", frozenset(self.retryable_status_codes))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 from promptum.providers.metrics import Metrics
@@ -14,4 +15,4 @@ class TestResult:
     metrics: Metrics | None
     validation_details: dict[str, Any]
     execution_error: str | None = None
-    timestamp: datetime = field(default_factory=lambda:datetime.now(UTC))
+    timestamp: datetime = field(default_factory=partial(datetime.now, UTC))
@@ -8,6 +8,31 @@ from promptum.providers.protocol import LLMProvider
 from promptum.session.case import Prompt
 from promptum.session.result import TestResult
 
+_EXECUTION_ERRORS = (ProviderError, ValueError, TypeError, httpx.HTTPError)
+
+
+class _ConcurrencyGate:
+    """Admission control for a single run, bound to the loop that run executes on."""
+
+    def __init__(self, runner: "Runner") -> None:
+        self._runner = runner
+        self._condition = asyncio.Condition()
+        self.in_flight = 0
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self._runner.max_concurrent)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify(1)
+
+    async def wake_all(self) -> None:
+        async with self._condition:
+            self._condition.notify_all()
+
 
 class Runner:
     def __init__(
@@ -16,31 +41,71 @@ class Runner:
         max_concurrent: int = 5,
         progress_callback: Callable[[int, int, TestResult], None] | None = None,
     ):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
         self.provider = provider
         self.max_concurrent = max_concurrent
         self.progress_callback = progress_callback
+        self._gates: set[_ConcurrencyGate] = set()
+
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        self.max_concurrent = max_concurrent
+        for gate in list(self._gates):
+            await gate.wake_all()
 
     async def run(self, test_cases: Sequence[Prompt]) -> list[TestResult]:
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        completed = 0
+        if not test_cases:
+            return []
+
         total = len(test_cases)
+        results: list[TestResult | None] = [None] * total
+        completed = 0
+
+        gate = _ConcurrencyGate(self)
+        self._gates.add(gate)
 
-        async def run_with_semaphore(test_case: Prompt) -> TestResult:
-            async with semaphore:
-                result = await self._run_single_test(test_case)
+        pending: asyncio.Queue[tuple[int, Prompt]] = asyncio.Queue()
+        for item in enumerate(test_cases):
+            pending.put_nowait(item)
 
-                nonlocal completed
-                completed += 1
-                if self.progress_callback:
-                    self.progress_callback(completed, total, result)
+        async def worker() -> None:
+            nonlocal completed
+            try:
+                while not pending.empty() and gate.in_flight <= self.max_concurrent:
+                    index, test_case = pending.get_nowait()
+                    result = await self._run_single_test(test_case)
+                    results[index] = result
 
-                return result
+                    completed += 1
+                    if self.progress_callback:
+                        self.progress_callback(completed, total, result)
+            finally:
+                await gate.release()
+
+        # Each worker holds one slot for its lifetime, so live tasks stay bounded
+        # by max_concurrent regardless of batch size.
+        error: Exception | None = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                while not pending.empty():
+                    await gate.acquire()
+                    tg.create_task(worker())
+        except ExceptionGroup as group:
+            # Only wrap when several prompts failed; a lone error propagates as itself.
+            if len(group.exceptions) > 1:
+                raise
+            error = group.exceptions[0]
+        finally:
+            self._gates.discard(gate)
 
-        results = await asyncio.gather(
-            *[run_with_semaphore(tc) for tc in test_cases],
-        )
+        if error is not None:
+            raise error
 
-        return list(results)
+        return results  # type: ignore[return-value]  # ty: ignore[invalid-return-type]
 
     async def _run_single_test(self, test_case: Prompt) -> TestResult:
         try:
@@ -64,12 +129,12 @@ class Runner:
                 execution_error=None,
             )
 
-        except (ProviderError, ValueError, TypeError, httpx.HTTPError) as e:
+        except _EXECUTION_ERRORS as e:
             return TestResult(
                 test_case=test_case,
                 response=None,
                 passed=False,
                 metrics=None,
                 validation_details={},
-                execution_error=str(e),
+                execution_error=f"{type(e).__name__}: {e}",
             )
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable
 
 from promptum.providers.protocol import LLMProvider
 from promptum.session.case import Prompt
@@ -15,18 +15,30 @@ class Session:
         max_concurrent: int = 5,
         progress_callback: Callable[[int, int, TestResult], None] | None = None,
     ):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
         self.provider = provider
         self.name = name
         self.max_concurrent = max_concurrent
         self.progress_callback = progress_callback
         self._test_cases: list[Prompt] = []
+        self._active_runners: set[Runner] = set()
 
     def add_test(self, test_case: Prompt) -> None:
         self._test_cases.append(test_case)
 
-    def add_tests(self, test_cases: Sequence[Prompt]) -> None:
+    def add_tests(self, test_cases: Iterable[Prompt]) -> None:
         self._test_cases.extend(test_cases)
 
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        self.max_concurrent = max_concurrent
+        for runner in list(self._active_runners):
+            await runner.set_max_concurrent(max_concurrent)
+
     async def run(self) -> Report:
         if not self._test_cases:
             return Report(results=[])
@@ -37,6 +49,10 @@ class Session:
             progress_callback=self.progress_callback,
         )
 
-        results = await runner.run(self._test_cases)
+        self._active_runners.add(runner)
+        try:
+            results = await runner.run(self._test_cases)
+        finally:
+            self._active_runners.discard(runner)
 
         return Report(results=results)
@@ -1,6 +1,6 @@
 import json
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -51,9 +51,13 @@ class Contains:
 class Regex:
     pattern: str
     flags: int = 0
+    _compiled: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_compiled", re.compile(self.pattern, self.flags))
 
     def validate(self, response: str) -> tuple[bool, dict[str, Any]]:
-        match = re.search(self.pattern, response, self.flags)
+        match = self._compiled.search(response)
         return match is not None, {
             "pattern": self.pattern,
             "matched": match.group(0) if match else None,
@@ -1,7 +1,13 @@
+import asyncio
+import gc
+import subprocess
+import sys
+import weakref
 from typing import Any
 from unittest.mock import AsyncMock
 
 import httpx
+import orjson
 import pytest
 
 from promptum.providers.exceptions import (
@@ -11,7 +17,7 @@ from promptum.providers.exceptions import (
     ProviderRetryExhaustedError,
     ProviderTransientError,
 )
-from promptum.providers.openrouter import OpenRouterClient
+from promptum.providers.openrouter import _SHARED_TRANSPORTS, OpenRouterClient, _acquire_transport
 from promptum.providers.retry import RetryConfig, RetryStrategy
 
 
@@ -26,6 +32,23 @@ def _make_response(
     )
 
 
+def test_package_import_defers_loading_openrouter():
+    code = (
+        "import sys, promptum, promptum.providers; "
+        "assert 'promptum.providers.openrouter' not in sys.modules; "
+        "assert promptum.OpenRouterClient is promptum.providers.OpenRouterClient"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package_unknown_attribute_raises_attribute_error():
+    import promptum.providers
+
+    with pytest.raises(AttributeError, match="NoSuchClient"):
+        promptum.providers.NoSuchClient  # noqa: B018
+
+
 async def test_generate_without_context_manager_raises_not_initialized():
     client = OpenRouterClient(api_key="test-key")
 
@@ -41,6 +64,99 @@ async def test_context_manager_closes_client_on_exit():
     assert inner_client.is_closed
 
 
+async def test_context_manager_reuses_client_across_calls(
+    successful_api_response: dict[str, Any],
+    no_retry_config: RetryConfig,
+):
+    async with OpenRouterClient(api_key="k", default_retry_config=no_retry_config) as client:
+        inner_client = client._client
+        client._client.post = AsyncMock(return_value=_make_response(200, successful_api_response))
+
+        await client.generate(prompt="hello", model="m")
+        await client.generate(prompt="again", model="m")
+
+        assert client._client is inner_client
+        assert inner_client.post.await_count == 2
+
+
+async def test_clients_on_same_loop_share_transport():
+    async with OpenRouterClient(api_key="a") as first, OpenRouterClient(api_key="b") as second:
+        assert first._client._transport is second._client._transport
+
+
+async def test_shared_transport_enables_http2(monkeypatch: pytest.MonkeyPatch):
+    created: list[dict[str, Any]] = []
+    original_init = httpx.AsyncHTTPTransport.__init__
+
+    def spy_init(self: httpx.AsyncHTTPTransport, **kwargs: Any) -> None:
+        created.append(kwargs)
+        original_init(self, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "__init__", spy_init)
+
+    async with OpenRouterClient(api_key="k"):
+        pass
+
+    assert [kwargs["http2"] for kwargs in created] == [True]
+
+
+async def test_shared_transport_closed_after_last_client_exits():
+    first = OpenRouterClient(api_key="a")
+    second = OpenRouterClient(api_key="b")
+
+    async with first:
+        shared = first._client._transport
+        async with second:
+            pass
+
+        assert first._client._transport is shared
+        assert shared._users == 1
+
+    assert shared._users == 0
+    async with OpenRouterClient(api_key="c") as third:
+        assert third._client._transport is not shared
+
+
+def test_closed_loop_is_garbage_collected():
+    async def use_client() -> None:
+        async with OpenRouterClient(api_key="k"):
+            pass
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(use_client())
+    loop.close()
+    loop_ref = weakref.ref(loop)
+    del loop
+    gc.collect()
+
+    assert loop_ref() is None
+    assert len(_SHARED_TRANSPORTS) == 0
+
+
+def test_transport_outside_asyncio_loop_is_private():
+    transport = _acquire_transport()
+
+    assert isinstance(transport, httpx.AsyncHTTPTransport)
+    assert len(_SHARED_TRANSPORTS) == 0
+
+
+def test_clients_on_different_loops_use_separate_transports():
+    async def open_transport() -> object:
+        async with OpenRouterClient(api_key="k") as client:
+            return client._client._transport
+
+    assert asyncio.run(open_transport()) is not asyncio.run(open_transport())
+
+
+async def test_generate_after_context_exit_raises_not_initialized():
+    client = OpenRouterClient(api_key="test-key")
+    async with client:
+        pass
+
+    with pytest.raises(ProviderNotInitializedError):
+        await client.generate(prompt="hello", model="test-model")
+
+
 async def test_generate_success_returns_content_and_metrics(
     successful_api_response: dict[str, Any],
     no_retry_config: RetryConfig,
@@ -191,6 +307,23 @@ async def test_generate_invalid_response_raises_parse_error(
         assert err.__cause__ is err.original_error
 
 
+async def test_generate_non_json_body_raises_parse_error(
+    no_retry_config: RetryConfig,
+):
+    response = httpx.Response(
+        status_code=200,
+        content=b"<html>bad gateway</html>",
+        request=httpx.Request("POST", "https://fake/chat/completions"),
+    )
+    async with OpenRouterClient(api_key="k", default_retry_config=no_retry_config) as client:
+        client._client.post = AsyncMock(return_value=response)
+
+        with pytest.raises(ProviderResponseParseError) as exc_info:
+            await client.generate(prompt="hello", model="m")
+
+    assert isinstance(exc_info.value.original_error, orjson.JSONDecodeError)
+
+
 @pytest.mark.parametrize("status_code", [429, 500], ids=["429", "500"])
 async def test_generate_retries_on_retryable_status_then_succeeds(
     successful_api_response: dict[str, Any],
@@ -292,6 +425,41 @@ async def test_generate_retry_delays_recorded_in_metrics(
 
     assert len(metrics.retry_delays) == 2
     assert all(d > 0 for d in metrics.retry_delays)
+    assert metrics.retry_delays == (0.01, 0.02)
+
+
+async def test_generate_first_attempt_success_has_no_retry_delays(
+    successful_api_response: dict[str, Any],
+    retry_config_3_attempts: RetryConfig,
+):
+    async with OpenRouterClient(
+        api_key="k", default_retry_config=retry_config_3_attempts
+    ) as client:
+        client._client.post = AsyncMock(return_value=_make_response(200, successful_api_response))
+
+        _, metrics = await client.generate(prompt="hello", model="m")
+
+    assert metrics.retry_delays == ()
+    assert metrics.total_attempts == 1
+
+
+async def test_generate_retry_delays_match_backoff_schedule(
+    retry_config_3_attempts: RetryConfig,
+):
+    responses = [_make_response(503) for _ in range(3)]
+    async with OpenRouterClient(
+        api_key="k", default_retry_config=retry_config_3_attempts
+    ) as client:
+        client._client.post = AsyncMock(side_effect=responses)
+        client._sleep = AsyncMock()
+
+        with pytest.raises(ProviderRetryExhaustedError) as exc_info:
+            await client.generate(prompt="hello", model="m")
+
+        slept = [c.args[0] for c in client._sleep.await_args_list]
+
+    assert exc_info.value.retry_delays == [0.01, 0.02]
+    assert slept == exc_info.value.retry_delays
 
 
 async def test_generate_transient_error_exhausts_retries_raises_transient_error(
@@ -7,6 +7,7 @@ def test_retry_config_defaults(default_retry_config: RetryConfig) -> None:
     assert default_retry_config.initial_delay == 1.0
     assert default_retry_config.max_delay == 60.0
     assert default_retry_config.exponential_base == 2.0
+    assert default_retry_config.retryable_status_codes == frozenset({429, 500, 502, 503, 504})
 
 
 def test_retry_config_custom() -> None:
@@ -18,3 +19,8 @@ def test_retry_config_custom() -> None:
     assert config.max_attempts == 5
     assert config.strategy == RetryStrategy.FIXED_DELAY
     assert config.initial_delay == 2.0
+
+
+def test_retry_config_normalizes_status_codes_to_frozenset() -> None:
+    config = RetryConfig(retryable_status_codes=[429, 503, 429])
+    assert config.retryable_status_codes == frozenset({429, 503})
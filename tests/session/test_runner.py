@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 from datetime import UTC
 from unittest.mock import AsyncMock, MagicMock
 
@@ -28,6 +29,19 @@ async def test_run_single_passing_test(
     assert result.timestamp.tzinfo == UTC
 
 
+async def test_run_results_are_frozen_and_slotted(
+    mock_provider: AsyncMock,
+    sample_prompt: Prompt,
+):
+    runner = Runner(provider=mock_provider)
+
+    results = await runner.run([sample_prompt])
+
+    assert not hasattr(results[0], "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        results[0].passed = False  # type: ignore[misc]
+
+
 async def test_run_single_failing_validation(
     mock_provider: AsyncMock,
     failing_prompt: Prompt,
@@ -75,6 +89,7 @@ async def test_run_empty_test_cases_returns_empty_list(mock_provider: AsyncMock)
     results = await runner.run([])
 
     assert results == []
+    mock_provider.generate.assert_not_awaited()
 
 
 @pytest.mark.parametrize(
@@ -103,6 +118,7 @@ async def test_run_provider_exception_returns_error_result(
     assert result.response is None
     assert result.metrics is None
     assert str(exception) in result.execution_error
+    assert result.execution_error.startswith(type(exception).__name__)
 
 
 async def test_run_progress_callback_called_for_each_test(
@@ -125,6 +141,61 @@ async def test_run_progress_callback_called_for_each_test(
         assert 1 <= completed <= 3
 
 
+async def test_run_simultaneous_unexpected_errors_raise_exception_group(
+    passing_validator: MagicMock,
+):
+    go = asyncio.Event()
+
+    async def generate(prompt: str, **kwargs):
+        await go.wait()
+        raise RuntimeError(prompt)
+
+    provider = AsyncMock()
+    provider.generate.side_effect = generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"fail-{i}", model="m", validator=passing_validator)
+        for i in range(2)
+    ]
+    runner = Runner(provider=provider, max_concurrent=2)
+
+    run_task = asyncio.create_task(runner.run(prompts))
+    await asyncio.sleep(0.01)
+    go.set()
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await run_task
+
+    assert len(exc_info.value.exceptions) == 2
+
+
+async def test_run_progress_callback_error_propagates_unwrapped(
+    mock_provider: AsyncMock,
+    sample_prompt: Prompt,
+):
+    callback = MagicMock(side_effect=KeyError("display gone"))
+    runner = Runner(provider=mock_provider, progress_callback=callback)
+
+    with pytest.raises(KeyError, match="display gone"):
+        await runner.run([sample_prompt])
+
+
+async def test_run_progress_callback_reports_increasing_completed_count(
+    mock_provider: AsyncMock,
+    passing_validator: MagicMock,
+):
+    callback = MagicMock()
+    prompts = [
+        Prompt(name=f"test-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(5)
+    ]
+    runner = Runner(provider=mock_provider, max_concurrent=2, progress_callback=callback)
+
+    results = await runner.run(prompts)
+
+    assert [c[0][0] for c in callback.call_args_list] == [1, 2, 3, 4, 5]
+    assert {id(c[0][2]) for c in callback.call_args_list} == {id(r) for r in results}
+
+
 async def test_run_respects_max_concurrent_limit(
     passing_validator: MagicMock,
 ):
@@ -154,3 +225,243 @@ async def test_run_respects_max_concurrent_limit(
     await runner.run(prompts)
 
     assert peak <= 3
+
+
+async def test_set_max_concurrent_raises_limit_during_run(
+    passing_validator: MagicMock,
+):
+    peak = 0
+    current = 0
+    release = asyncio.Event()
+
+    async def blocking_generate(**kwargs):
+        nonlocal peak, current
+        current += 1
+        peak = max(peak, current)
+        await release.wait()
+        current -= 1
+        return ("response", Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = blocking_generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(6)
+    ]
+    runner = Runner(provider=provider, max_concurrent=2)
+
+    run_task = asyncio.create_task(runner.run(prompts))
+    await asyncio.sleep(0.01)
+    assert current == 2
+
+    await runner.set_max_concurrent(4)
+    await asyncio.sleep(0.01)
+    assert current == 4
+
+    release.set()
+    results = await run_task
+
+    assert len(results) == 6
+    assert peak == 4
+
+
+async def test_set_max_concurrent_rejects_non_positive(mock_provider: AsyncMock):
+    runner = Runner(provider=mock_provider)
+
+    with pytest.raises(ValueError, match="max_concurrent"):
+        await runner.set_max_concurrent(0)
+
+
+def test_init_rejects_non_positive_max_concurrent(mock_provider: AsyncMock):
+    with pytest.raises(ValueError, match="max_concurrent"):
+        Runner(provider=mock_provider, max_concurrent=0)
+
+
+async def test_run_preserves_input_order_when_completing_out_of_order(
+    passing_validator: MagicMock,
+):
+    async def delayed_generate(prompt: str, **kwargs):
+        await asyncio.sleep(0.01 * (5 - int(prompt)))
+        return (prompt, Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = delayed_generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=str(i), model="m", validator=passing_validator)
+        for i in range(5)
+    ]
+    runner = Runner(provider=provider, max_concurrent=5)
+
+    results = await runner.run(prompts)
+
+    assert [r.response for r in results] == ["0", "1", "2", "3", "4"]
+    assert [r.test_case for r in results] == prompts
+
+
+async def test_run_executes_prompts_in_parallel_up_to_limit(
+    passing_validator: MagicMock,
+):
+    async def slow_generate(**kwargs):
+        await asyncio.sleep(0.05)
+        return ("response", Metrics(latency_ms=50.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = slow_generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(10)
+    ]
+    runner = Runner(provider=provider, max_concurrent=10)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await runner.run(prompts)
+    elapsed = loop.time() - start
+
+    assert elapsed < 0.25
+
+
+async def test_run_unexpected_error_cancels_pending_prompts(
+    passing_validator: MagicMock,
+):
+    started: list[str] = []
+
+    async def generate(prompt: str, **kwargs):
+        started.append(prompt)
+        if prompt == "boom":
+            raise RuntimeError("unexpected")
+        await asyncio.sleep(10)
+        return ("response", Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = generate
+    prompts = [
+        Prompt(name=f"t-{p}", prompt=p, model="m", validator=passing_validator)
+        for p in ("slow", "boom", "queued-1", "queued-2")
+    ]
+    runner = Runner(provider=provider, max_concurrent=2)
+
+    with pytest.raises(RuntimeError, match="unexpected"):
+        await asyncio.wait_for(runner.run(prompts), timeout=1)
+
+    assert len(started) < len(prompts)
+    assert not runner._gates
+
+
+async def test_set_max_concurrent_lowers_limit_during_run(
+    passing_validator: MagicMock,
+):
+    current = 0
+    resized = False
+    started_before_resize = 0
+    peak_after_drain = 0
+    calls_after_drain = 0
+
+    async def slow_generate(**kwargs):
+        nonlocal current, started_before_resize, peak_after_drain, calls_after_drain
+        before_resize = not resized
+        current += 1
+        if before_resize:
+            started_before_resize += 1
+        elif started_before_resize == 0:
+            calls_after_drain += 1
+            peak_after_drain = max(peak_after_drain, current)
+        await asyncio.sleep(0.02)
+        current -= 1
+        if before_resize:
+            started_before_resize -= 1
+        return ("response", Metrics(latency_ms=20.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = slow_generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(12)
+    ]
+    runner = Runner(provider=provider, max_concurrent=4)
+
+    run_task = asyncio.create_task(runner.run(prompts))
+    await asyncio.sleep(0.01)
+    assert current == 4
+    await runner.set_max_concurrent(1)
+    resized = True
+    results = await run_task
+
+    assert len(results) == 12
+    assert all(r.passed for r in results)
+    assert calls_after_drain > 0
+    assert peak_after_drain == 1
+    assert current == 0
+
+
+async def test_run_keeps_task_count_bounded_by_max_concurrent(
+    passing_validator: MagicMock,
+):
+    max_tasks = 0
+
+    async def generate(**kwargs):
+        nonlocal max_tasks
+        max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        return ("response", Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(200)
+    ]
+    runner = Runner(provider=provider, max_concurrent=3)
+    baseline = len(asyncio.all_tasks())
+
+    results = await runner.run(prompts)
+
+    assert len(results) == 200
+    assert max_tasks <= baseline + 3
+
+
+def test_runner_reusable_across_event_loops(passing_validator: MagicMock):
+    async def generate(**kwargs):
+        await asyncio.sleep(0)
+        return ("response", Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(6)
+    ]
+    runner = Runner(provider=provider, max_concurrent=2)
+
+    first = asyncio.run(runner.run(prompts))
+    second = asyncio.run(runner.run(prompts))
+
+    assert len(first) == 6
+    assert len(second) == 6
+
+
+async def test_concurrent_runs_each_get_their_own_limit(
+    passing_validator: MagicMock,
+):
+    peak = 0
+    current = 0
+
+    async def slow_generate(**kwargs):
+        nonlocal peak, current
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.02)
+        current -= 1
+        return ("response", Metrics(latency_ms=20.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = slow_generate
+    prompts = [
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(4)
+    ]
+    runner = Runner(provider=provider, max_concurrent=2)
+
+    await asyncio.gather(runner.run(prompts), runner.run(prompts))
+
+    assert peak == 4
@@ -1,5 +1,9 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from promptum.providers.metrics import Metrics
 from promptum.session.case import Prompt
 from promptum.session.report import Report
 from promptum.session.session import Session
@@ -29,6 +33,18 @@ async def test_add_tests_extends_internal_list(
     assert len(session._test_cases) == 2
 
 
+async def test_add_tests_accepts_generator(
+    mock_provider: AsyncMock,
+    sample_prompt: Prompt,
+    failing_prompt: Prompt,
+):
+    session = Session(provider=mock_provider)
+
+    session.add_tests(p for p in (sample_prompt, failing_prompt))
+
+    assert session._test_cases == [sample_prompt, failing_prompt]
+
+
 async def test_run_empty_returns_empty_report(mock_provider: AsyncMock):
     session = Session(provider=mock_provider)
 
@@ -93,3 +109,60 @@ async def test_run_passes_progress_callback(
             max_concurrent=5,
             progress_callback=callback,
         )
+
+
+async def test_set_max_concurrent_applies_to_running_session(
+    passing_validator: MagicMock,
+):
+    current = 0
+    release = asyncio.Event()
+
+    async def blocking_generate(**kwargs):
+        nonlocal current
+        current += 1
+        await release.wait()
+        current -= 1
+        return ("response", Metrics(latency_ms=1.0))
+
+    provider = AsyncMock()
+    provider.generate.side_effect = blocking_generate
+    session = Session(provider=provider, max_concurrent=1)
+    session.add_tests(
+        Prompt(name=f"t-{i}", prompt=f"p{i}", model="m", validator=passing_validator)
+        for i in range(4)
+    )
+
+    run_task = asyncio.create_task(session.run())
+    await asyncio.sleep(0.01)
+    assert current == 1
+
+    await session.set_max_concurrent(3)
+    await asyncio.sleep(0.01)
+    assert current == 3
+    assert session.max_concurrent == 3
+
+    release.set()
+    report = await run_task
+
+    assert len(report.results) == 4
+    assert not session._active_runners
+
+
+async def test_set_max_concurrent_before_run_updates_limit(mock_provider: AsyncMock):
+    session = Session(provider=mock_provider)
+
+    await session.set_max_concurrent(8)
+
+    assert session.max_concurrent == 8
+
+
+async def test_set_max_concurrent_rejects_non_positive(mock_provider: AsyncMock):
+    session = Session(provider=mock_provider)
+
+    with pytest.raises(ValueError, match="max_concurrent"):
+        await session.set_max_concurrent(0)
+
+
+def test_init_rejects_non_positive_max_concurrent(mock_provider: AsyncMock):
+    with pytest.raises(ValueError, match="max_concurrent"):
+        Session(provider=mock_provider, max_concurrent=0)
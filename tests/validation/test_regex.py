@@ -1,3 +1,7 @@
+import re
+
+import pytest
+
 from promptum.validation import Regex
 
 
@@ -29,3 +33,16 @@ def test_regex_describe() -> None:
     description = validator.describe()
     assert "Regex" in description
     assert r"\d+" in description
+
+
+def test_regex_flags() -> None:
+    validator = Regex(r"hello", flags=re.IGNORECASE)
+
+    passed, details = validator.validate("HELLO world")
+    assert passed is True
+    assert details["matched"] == "HELLO"
+
+
+def test_regex_invalid_pattern_raises_on_creation() -> None:
+    with pytest.raises(re.error):
+        Regex(r"(unclosed")